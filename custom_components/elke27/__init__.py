@@ -94,13 +94,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         msg = "Link keys are missing; relink required"
         raise ConfigEntryAuthFailed(msg)
     integration_serial = entry.data.get(CONF_INTEGRATION_SERIAL)
-    entry_data = dict(entry.data)
-    pin_removed = entry_data.pop("pin", None)
-    if not integration_serial:
-        integration_serial = await async_get_integration_serial(hass, host)
-        entry_data[CONF_INTEGRATION_SERIAL] = integration_serial
-        hass.config_entries.async_update_entry(entry, data=entry_data)
-    elif pin_removed is not None:
+    if not integration_serial or entry.data.get("pin") is not None:
+        # Only copy the entry data when it actually needs rewriting.
+        entry_data = dict(entry.data)
+        entry_data.pop("pin", None)
+        if not integration_serial:
+            integration_serial = await async_get_integration_serial(hass, host)
+            entry_data[CONF_INTEGRATION_SERIAL] = integration_serial
         hass.config_entries.async_update_entry(entry, data=entry_data)
     if panel_name:
         _LOGGER.debug("Discovered panel name: %s", panel_name)
@@ -128,21 +128,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await coordinator.async_start()
     await coordinator.async_refresh_now()
     domains_to_prime = ("light", "lock", "tstat")
-    refresh_domain_config = getattr(hub, "refresh_domain_config", None)
-    if callable(refresh_domain_config):
-        prime_results = await asyncio.gather(
-            *(refresh_domain_config(domain) for domain in domains_to_prime),
-            return_exceptions=True,
-        )
-        for domain, result in zip(domains_to_prime, prime_results, strict=True):
-            if isinstance(result, Exception):
-                _LOGGER.debug("Initial refresh for %s failed: %s", domain, result)
-
-    snapshot = hub.get_snapshot() if hasattr(hub, "get_snapshot") else None
-    if hasattr(coordinator, "async_set_updated_data"):
-        coordinator.async_set_updated_data(snapshot)
-    else:
-        coordinator.data = snapshot
+    prime_results = await asyncio.gather(
+        *(hub.refresh_domain_config(domain) for domain in domains_to_prime),
+        return_exceptions=True,
+    )
+    for domain, result in zip(domains_to_prime, prime_results, strict=True):
+        if isinstance(result, Exception):
+            _LOGGER.debug("Initial refresh for %s failed: %s", domain, result)
+
+    coordinator.async_set_updated_data(hub.get_snapshot())
     await _async_migrate_unique_ids(hass, entry, unique_base(hub, coordinator, entry))
     entry.runtime_data = Elke27RuntimeData(hub=hub, coordinator=coordinator)
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Mapping
 import logging
+import re
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from elke27_lib import ArmMode
-from elke27_lib.errors import Elke27PinRequiredError
 
 from homeassistant.components.alarm_control_panel import (
     AlarmControlPanelEntity,
@@ -19,7 +20,16 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import Elke27DataUpdateCoordinator
-from .entity import build_unique_id, device_info_for_entry, sanitize_name, unique_base
+from .entity import (
+    async_setup_snapshot_entities,
+    build_unique_id,
+    device_info_for_entry,
+    get_snapshot_item,
+    iter_snapshot_items,
+    pin_required_error,
+    sanitize_name,
+    unique_base,
+)
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -27,12 +37,42 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
     from .hub import Elke27Hub
-    from .models import Elke27RuntimeData
 
 _LOGGER = logging.getLogger(__name__)
 
 PARALLEL_UPDATES = 0
 
+_NUMERIC_CODE_RE = re.compile(r"[0-9]+")
+
+_MISSING_AREA_ATTRIBUTES: Mapping[str, Any] = MappingProxyType(
+    {
+        "ready": None,
+        "ready_status": None,
+        "ready_status_display": None,
+        "trouble": None,
+        "faulted_zone_ids": None,
+        "faulted_zones": None,
+    }
+)
+
+_READY_STATUS_DISPLAY: dict[str, str] = {
+    "RDY_AWAY": "Ready away",
+    "RDY_STAY": "Ready stay",
+    "RDY_NOT": "Not ready",
+}
+
+_CUSTOM_BYPASS_ARM_MODE: ArmMode | None = getattr(ArmMode, "ARMED_CUSTOM_BYPASS", None)
+_ARM_MODE_TO_STATE: dict[ArmMode, AlarmControlPanelState] = {
+    ArmMode.DISARMED: AlarmControlPanelState.DISARMED,
+    ArmMode.ARMED_STAY: AlarmControlPanelState.ARMED_HOME,
+    ArmMode.ARMED_NIGHT: AlarmControlPanelState.ARMED_NIGHT,
+    ArmMode.ARMED_AWAY: AlarmControlPanelState.ARMED_AWAY,
+}
+if _CUSTOM_BYPASS_ARM_MODE is not None:
+    _ARM_MODE_TO_STATE[_CUSTOM_BYPASS_ARM_MODE] = (
+        AlarmControlPanelState.ARMED_CUSTOM_BYPASS
+    )
+
 
 async def async_setup_entry(
     _hass: HomeAssistant,
@@ -40,42 +80,14 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up Elke27 area alarm control panels from a config entry."""
-    data: Elke27RuntimeData | None = entry.runtime_data
-    if data is None:
-        _LOGGER.debug(
-            "Skipping alarm control panel setup because runtime data is missing"
-        )
-        return
-    hub = data.hub
-    coordinator = data.coordinator
-    known_ids: set[int] = set()
-
-    def _async_add_areas() -> None:
-        snapshot = coordinator.data
-        if snapshot is None:
-            _LOGGER.debug("Area entities skipped because snapshot is unavailable")
-            return
-        entities: list[Elke27AreaAlarmControlPanel] = []
-        areas = list(_iter_areas(snapshot))
-        if not areas:
-            _LOGGER.debug("No areas available for entity creation")
-            return
-        for area in areas:
-            area_id = getattr(area, "area_id", None)
-            if not isinstance(area_id, int):
-                continue
-            if area_id in known_ids:
-                continue
-            known_ids.add(area_id)
-            entities.append(
-                Elke27AreaAlarmControlPanel(coordinator, hub, entry, area_id, area)
-            )
-        if entities:
-            _LOGGER.debug("Adding %s area entities", len(entities))
-            async_add_entities(entities)
-
-    _async_add_areas()
-    entry.async_on_unload(coordinator.async_add_listener(_async_add_areas))
+    async_setup_snapshot_entities(
+        entry,
+        async_add_entities,
+        collection="areas",
+        id_field="area_id",
+        label="area",
+        entity_factory=Elke27AreaAlarmControlPanel,
+    )
 
 
 class Elke27AreaAlarmControlPanel(
@@ -126,22 +138,15 @@ class Elke27AreaAlarmControlPanel(
         return _area_state_to_ha(area)
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional state attributes."""
         area = _get_area(self.coordinator.data, self._area_id)
         if area is None:
-            return {
-                "ready": None,
-                "ready_status": None,
-                "ready_status_display": None,
-                "trouble": None,
-                "faulted_zone_ids": None,
-                "faulted_zones": None,
-            }
+            return _MISSING_AREA_ATTRIBUTES
         faulted_zones = _faulted_zones(self.coordinator.data)
         ready_status_display = (
             _ready_status_display(area)
-            if self.alarm_state == AlarmControlPanelState.DISARMED
+            if _area_state_to_ha(area) == AlarmControlPanelState.DISARMED
             else None
         )
         return {
@@ -177,30 +182,21 @@ class Elke27AreaAlarmControlPanel(
         """Arm the area with a custom bypass."""
         code = _normalize_code(code)
         for zone_id, _ in _faulted_zones(self.coordinator.data):
-            try:
+            with pin_required_error():
                 await self._hub.async_set_zone_bypass(zone_id, bypassed=True, pin=code)
-            except Elke27PinRequiredError as err:
-                msg = "PIN required to perform this action."
-                raise HomeAssistantError(msg) from err
         await self._async_arm(ArmMode.ARMED_AWAY, code)
 
     async def async_alarm_disarm(self, code: str | None = None) -> None:
         """Disarm the area."""
         code = _normalize_code(code)
-        try:
+        with pin_required_error():
             await self._hub.async_disarm_area(self._area_id, code)
-        except Elke27PinRequiredError as err:
-            msg = "PIN required to perform this action."
-            raise HomeAssistantError(msg) from err
 
     async def _async_arm(self, mode: ArmMode, code: str | None) -> None:
         """Arm the area using the requested mode."""
         code = _normalize_code(code)
-        try:
+        with pin_required_error():
             await self._hub.async_arm_area(self._area_id, mode, code)
-        except Elke27PinRequiredError as err:
-            msg = "PIN required to perform this action."
-            raise HomeAssistantError(msg) from err
 
     def _log_missing(self) -> None:
         """Log when the area snapshot is missing."""
@@ -210,22 +206,8 @@ class Elke27AreaAlarmControlPanel(
         _LOGGER.debug("Area %s missing from snapshot", self._area_id)
 
 
-def _iter_areas(snapshot: Any) -> Iterable[Any]:
-    areas = getattr(snapshot, "areas", None)
-    if areas is None:
-        return []
-    if isinstance(areas, Mapping):
-        return list(areas.values())
-    if isinstance(areas, list | tuple):
-        return areas
-    return []
-
-
 def _get_area(snapshot: Any, area_id: int) -> Any | None:
-    for area in _iter_areas(snapshot):
-        if getattr(area, "area_id", None) == area_id:
-            return area
-    return None
+    return get_snapshot_item(snapshot, "areas", "area_id", area_id)
 
 
 def _area_state_to_ha(area: Any) -> AlarmControlPanelState:
@@ -235,17 +217,9 @@ def _area_state_to_ha(area: Any) -> AlarmControlPanelState:
     if arm_mode is None:
         return AlarmControlPanelState.DISARMED
     if isinstance(arm_mode, ArmMode):
-        custom_mode = _custom_bypass_mode()
-        if arm_mode is custom_mode:
-            return AlarmControlPanelState.ARMED_CUSTOM_BYPASS
-        if arm_mode is ArmMode.DISARMED:
-            return AlarmControlPanelState.DISARMED
-        if arm_mode is ArmMode.ARMED_STAY:
-            return AlarmControlPanelState.ARMED_HOME
-        if arm_mode is ArmMode.ARMED_NIGHT:
-            return AlarmControlPanelState.ARMED_NIGHT
-        if arm_mode is ArmMode.ARMED_AWAY:
-            return AlarmControlPanelState.ARMED_AWAY
+        state = _ARM_MODE_TO_STATE.get(arm_mode)
+        if state is not None:
+            return state
     mode_value = str(arm_mode).lower()
     if mode_value in {"disarmed", "disarm"}:
         return AlarmControlPanelState.DISARMED
@@ -260,10 +234,6 @@ def _area_state_to_ha(area: Any) -> AlarmControlPanelState:
     return AlarmControlPanelState.ARMED_AWAY
 
 
-def _custom_bypass_mode() -> ArmMode | str:
-    return getattr(ArmMode, "ARMED_CUSTOM_BYPASS", "ARMED_CUSTOM_BYPASS")
-
-
 def _ready_status_value(area: Any) -> str | None:
     ready_status = getattr(area, "ready_status", None)
     if ready_status is None and isinstance(area, Mapping):
@@ -275,40 +245,22 @@ def _ready_status_display(area: Any) -> str | None:
     ready_status = _ready_status_value(area)
     if ready_status is None:
         return None
-    status = ready_status.upper()
-    if status == "RDY_AWAY":
-        return "Ready away"
-    if status == "RDY_STAY":
-        return "Ready stay"
-    if status == "RDY_NOT":
-        return "Not ready"
-    return None
+    return _READY_STATUS_DISPLAY.get(ready_status.upper())
 
 
 def _faulted_zones(snapshot: Any) -> list[tuple[int, str]]:
-    zones = getattr(snapshot, "zones", None) if snapshot is not None else None
-    if zones is None:
-        return []
-    if isinstance(zones, Mapping):
-        zone_values = list(zones.values())
-    elif isinstance(zones, list | tuple):
-        zone_values = list(zones)
-    else:
-        return []
     definitions = getattr(snapshot, "zone_definitions", None)
     results: list[tuple[int, str]] = []
-    for zone in zone_values:
-        zone_id = getattr(zone, "zone_id", None)
-        if not isinstance(zone_id, int):
+    for zone in iter_snapshot_items(snapshot, "zones"):
+        # Most zones are closed; reject them before any other lookups.
+        if getattr(zone, "open", None) is not True:
             continue
-        is_open = getattr(zone, "open", None)
-        if not isinstance(is_open, bool) or not is_open:
+        if getattr(zone, "bypassed", None) is True:
             continue
-        bypassed = getattr(zone, "bypassed", None)
-        if isinstance(bypassed, bool) and bypassed:
+        zone_id = getattr(zone, "zone_id", None)
+        if not isinstance(zone_id, int):
             continue
-        name = _zone_display_name(zone, definitions)
-        results.append((zone_id, name))
+        results.append((zone_id, _zone_display_name(zone, definitions)))
     return results
 
 
@@ -331,7 +283,7 @@ def _normalize_code(code: str | None) -> str | None:
     if code is None:
         return None
     normalized = code.strip()
-    if not normalized.isdigit():
+    if _NUMERIC_CODE_RE.fullmatch(normalized) is None:
         msg = "Code must be numeric."
         raise HomeAssistantError(msg)
     return normalized
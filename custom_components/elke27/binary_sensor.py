@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
+from collections.abc import Mapping
 import logging
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.binary_sensor import (
@@ -13,7 +14,14 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import Elke27DataUpdateCoordinator
-from .entity import build_unique_id, device_info_for_entry, sanitize_name, unique_base
+from .entity import (
+    build_unique_id,
+    device_info_for_entry,
+    get_snapshot_item,
+    iter_snapshot_items,
+    sanitize_name,
+    unique_base,
+)
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -27,6 +35,8 @@ _LOGGER = logging.getLogger(__name__)
 
 PARALLEL_UPDATES = 0
 
+_NO_ATTRIBUTES: Mapping[str, Any] = MappingProxyType({})
+
 _ZONE_ICON_BY_DEFINITION = {
     "UNDEFINED": "mdi:help-circle-outline",
     "BURG EE DELAY": "mdi:door-closed-lock",
@@ -44,6 +54,7 @@ _ZONE_ICON_BY_DEFINITION = {
     "HILO TEMP": "mdi:thermometer",
 }
 _ZONE_OPEN_ICON_BY_DEFINITION = {
+    **_ZONE_ICON_BY_DEFINITION,
     "BURG EE DELAY": "mdi:door-open",
     "BURG PERIM INST": "mdi:window-open",
     "BURG INTERIOR": "mdi:motion-sensor",
@@ -81,7 +92,7 @@ async def async_setup_entry(
             _LOGGER.debug("Zone entities skipped because snapshot is unavailable")
             return
         entities: list[Elke27ZoneBinarySensor] = []
-        zones = list(_iter_zones(snapshot))
+        zones = list(iter_snapshot_items(snapshot, "zones"))
         if not zones:
             _LOGGER.debug("No zones available for entity creation")
             return
@@ -176,30 +187,21 @@ class Elke27ZoneBinarySensor(
     @property
     def icon(self) -> str | None:
         """Return the icon based on zone definition and state."""
-        zone = _get_zone(self.coordinator.data, self._zone_id)
-        if zone is None:
-            return None
-        zone_definition = _zone_definition_entry(self.coordinator.data, self._zone_id)
-        definition = _zone_definition_value(zone, zone_definition)
+        zone, definition = _zone_with_definition(self.coordinator.data, self._zone_id)
         if not definition:
             return None
-        is_open = getattr(zone, "open", None)
-        if isinstance(is_open, bool) and is_open:
-            return _ZONE_OPEN_ICON_BY_DEFINITION.get(
-                definition
-            ) or _ZONE_ICON_BY_DEFINITION.get(definition)
+        if getattr(zone, "open", None) is True:
+            return _ZONE_OPEN_ICON_BY_DEFINITION.get(definition)
         return _ZONE_ICON_BY_DEFINITION.get(definition)
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return additional state attributes."""
-        zone = _get_zone(self.coordinator.data, self._zone_id)
+        zone, definition = _zone_with_definition(self.coordinator.data, self._zone_id)
         if zone is None:
-            return {}
+            return _NO_ATTRIBUTES
         return {
-            "definition": _zone_definition_value(
-                zone, _zone_definition_entry(self.coordinator.data, self._zone_id)
-            ),
+            "definition": definition,
             "bypassed": getattr(zone, "bypassed", None),
             "trouble": getattr(zone, "trouble", None),
         }
@@ -220,22 +222,15 @@ class Elke27ZoneBinarySensor(
         _LOGGER.debug("Zone %s missing from snapshot", self._zone_id)
 
 
-def _iter_zones(snapshot: Any) -> Iterable[Any]:
-    zones = getattr(snapshot, "zones", None)
-    if zones is None:
-        return []
-    if isinstance(zones, Mapping):
-        return list(zones.values())
-    if isinstance(zones, list | tuple):
-        return zones
-    return []
+def _get_zone(snapshot: Any, zone_id: int) -> Any | None:
+    return get_snapshot_item(snapshot, "zones", "zone_id", zone_id)
 
 
-def _get_zone(snapshot: Any, zone_id: int) -> Any | None:
-    for zone in _iter_zones(snapshot):
-        if getattr(zone, "zone_id", None) == zone_id:
-            return zone
-    return None
+def _zone_with_definition(snapshot: Any, zone_id: int) -> tuple[Any | None, str | None]:
+    zone = _get_zone(snapshot, zone_id)
+    if zone is None:
+        return None, None
+    return zone, _zone_definition_value(zone, _zone_definition_entry(snapshot, zone_id))
 
 
 def _zone_definition_entry(snapshot: Any | None, zone_id: int) -> Any | None:
@@ -2,12 +2,9 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
 import logging
 from typing import TYPE_CHECKING, Any, ClassVar
 
-from elke27_lib.errors import Elke27PinRequiredError
-
 from homeassistant.components.climate import (
     ATTR_TARGET_TEMP_HIGH,
     ATTR_TARGET_TEMP_LOW,
@@ -23,7 +20,15 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import Elke27DataUpdateCoordinator
-from .entity import build_unique_id, device_info_for_entry, sanitize_name, unique_base
+from .entity import (
+    async_setup_snapshot_entities,
+    build_unique_id,
+    device_info_for_entry,
+    get_snapshot_item,
+    pin_required_error,
+    sanitize_name,
+    unique_base,
+)
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -31,7 +36,6 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
     from .hub import Elke27Hub
-    from .models import Elke27RuntimeData
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,37 +70,14 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up Elke27 thermostats from a config entry."""
-    data: Elke27RuntimeData | None = entry.runtime_data
-    if data is None:
-        _LOGGER.debug("Skipping climate setup because runtime data is missing")
-        return
-    hub = data.hub
-    coordinator = data.coordinator
-    known_ids: set[int] = set()
-
-    def _async_add_tstats() -> None:
-        snapshot = coordinator.data
-        if snapshot is None:
-            _LOGGER.debug("Thermostat entities skipped because snapshot is unavailable")
-            return
-        entities: list[Elke27Thermostat] = []
-        tstats = list(_iter_tstats(snapshot))
-        if not tstats:
-            _LOGGER.debug("No thermostats available for entity creation")
-            return
-        for tstat in tstats:
-            tstat_id = getattr(tstat, "tstat_id", None)
-            if not isinstance(tstat_id, int):
-                continue
-            if tstat_id in known_ids:
-                continue
-            known_ids.add(tstat_id)
-            entities.append(Elke27Thermostat(coordinator, hub, entry, tstat_id, tstat))
-        if entities:
-            async_add_entities(entities)
-
-    _async_add_tstats()
-    entry.async_on_unload(coordinator.async_add_listener(_async_add_tstats))
+    async_setup_snapshot_entities(
+        entry,
+        async_add_entities,
+        collection="thermostats",
+        id_field="tstat_id",
+        label="thermostat",
+        entity_factory=Elke27Thermostat,
+    )
 
 
 class Elke27Thermostat(
@@ -225,11 +206,8 @@ class Elke27Thermostat(
         if mode is None:
             msg = "HVAC mode is not supported."
             raise HomeAssistantError(msg)
-        try:
+        with pin_required_error():
             await self._hub.async_set_tstat_status(self._tstat_id, mode=mode)
-        except Elke27PinRequiredError as err:
-            msg = "PIN required to perform this action."
-            raise HomeAssistantError(msg) from err
 
     async def async_set_fan_mode(self, fan_mode: str) -> None:
         """Set a new fan mode."""
@@ -237,11 +215,8 @@ class Elke27Thermostat(
         if value is None:
             msg = "Fan mode is not supported."
             raise HomeAssistantError(msg)
-        try:
+        with pin_required_error():
             await self._hub.async_set_tstat_status(self._tstat_id, fan_mode=value)
-        except Elke27PinRequiredError as err:
-            msg = "PIN required to perform this action."
-            raise HomeAssistantError(msg) from err
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Set target temperatures."""
@@ -261,15 +236,12 @@ class Elke27Thermostat(
             msg = "At least one target temperature is required."
             raise HomeAssistantError(msg)
 
-        try:
+        with pin_required_error():
             await self._hub.async_set_tstat_status(
                 self._tstat_id,
                 heat_setpoint=heat_setpoint,
                 cool_setpoint=cool_setpoint,
             )
-        except Elke27PinRequiredError as err:
-            msg = "PIN required to perform this action."
-            raise HomeAssistantError(msg) from err
 
     def _log_missing(self) -> None:
         """Log when the thermostat snapshot is missing."""
@@ -279,30 +251,8 @@ class Elke27Thermostat(
         _LOGGER.debug("Thermostat %s missing from snapshot", self._tstat_id)
 
 
-def _iter_tstats(snapshot: Any) -> Iterable[Any]:
-    thermostats = getattr(snapshot, "thermostats", None)
-    if thermostats is None:
-        return []
-    if isinstance(thermostats, Mapping):
-        return list(thermostats.values())
-    if isinstance(thermostats, list | tuple):
-        return thermostats
-    return []
-
-
-def _tstat_id_of(tstat: Any) -> int | None:
-    tstat_id = getattr(tstat, "tstat_id", None)
-    if isinstance(tstat_id, int):
-        return tstat_id
-    return None
-
-
 def _get_tstat(snapshot: Any, tstat_id: int) -> Any | None:
-    for tstat in _iter_tstats(snapshot):
-        entity_id = _tstat_id_of(tstat)
-        if entity_id == tstat_id:
-            return tstat
-    return None
+    return get_snapshot_item(snapshot, "thermostats", "tstat_id", tstat_id)
 
 
 def _normalize_temperature(value: Any) -> float | None:
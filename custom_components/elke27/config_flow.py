@@ -63,6 +63,16 @@ STEP_LINK_DATA_SCHEMA = vol.Schema(
 
 STEP_REAUTH_DATA_SCHEMA = STEP_LINK_DATA_SCHEMA
 
+# Discovery key aliases, in priority order, for each normalized panel key.
+_PANEL_KEY_ALIASES: tuple[tuple[str, str], ...] = (
+    ("host", "ip"),
+    ("host", "panel_host"),
+    ("port", "panel_port"),
+    ("name", "panel_name"),
+    ("mac", "panel_mac"),
+    ("model", "panel_model"),
+)
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_SETUP_METHOD, default=SETUP_METHOD_DISCOVER): selector(
@@ -313,8 +323,8 @@ class Elke27ConfigFlow(ConfigFlow, domain=DOMAIN):
 
             snapshot = client.snapshot
             panel_info = _snapshot_to_dict(
-                getattr(snapshot, "panel_info", None)
-                or getattr(snapshot, "panel", None)
+                getattr(snapshot, "panel", None)
+                or getattr(snapshot, "panel_info", None)
             )
             table_info = _snapshot_to_dict(getattr(snapshot, "table_info", None))
         except InvalidCredentials:
@@ -452,29 +462,19 @@ def _panel_to_dict(panel: Any | None) -> dict[str, Any]:
         return _normalize_panel_keys(dict(panel))
     return _normalize_panel_keys(
         {
-            key: getattr(panel, key, None)
+            key: value
             for key in ("host", "port", "name", "model", "mac")
-            if getattr(panel, key, None) is not None
+            if (value := getattr(panel, key, None)) is not None
         }
     )
 
 
 def _normalize_panel_keys(panel: dict[str, Any]) -> dict[str, Any]:
-    """Normalize discovery panel keys to the expected schema."""
-    normalized = dict(panel)
-    if "host" not in normalized and "ip" in normalized:
-        normalized["host"] = normalized.get("ip")
-    if "host" not in normalized and "panel_host" in normalized:
-        normalized["host"] = normalized.get("panel_host")
-    if "port" not in normalized and "panel_port" in normalized:
-        normalized["port"] = normalized.get("panel_port")
-    if "name" not in normalized and "panel_name" in normalized:
-        normalized["name"] = normalized.get("panel_name")
-    if "mac" not in normalized and "panel_mac" in normalized:
-        normalized["mac"] = normalized.get("panel_mac")
-    if "model" not in normalized and "panel_model" in normalized:
-        normalized["model"] = normalized.get("panel_model")
-    return normalized
+    """Normalize discovery panel keys to the expected schema in place."""
+    for key, alias in _PANEL_KEY_ALIASES:
+        if key not in panel and alias in panel:
+            panel[key] = panel[alias]
+    return panel
 
 
 def _panel_mac(panel_info: dict[str, Any]) -> str | None:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 import contextlib
 import logging
 from typing import TYPE_CHECKING, Any
@@ -36,6 +37,17 @@ except ModuleNotFoundError:  # pragma: no cover - handled via class name fallbac
 
 _LOGGER = logging.getLogger(__name__)
 
+# Events that only require a debounced per-domain config refresh.
+_DOMAIN_REFRESH_EVENT_CLASSES: tuple[type[Any], ...] = tuple(
+    klass for klass in (DomainCsmChanged, TableCsmChanged) if klass is not None
+)
+_DOMAIN_REFRESH_EVENT_NAMES: frozenset[str] = frozenset(
+    {"DomainCsmChanged", "TableCsmChanged"}
+)
+
+# Marks that no snapshot has been published to listeners yet.
+_UNSET: Any = object()
+
 type PanelSnapshot = Any
 
 
@@ -58,6 +70,10 @@ class Elke27DataUpdateCoordinator(DataUpdateCoordinator[PanelSnapshot]):
         self._refresh_lock = asyncio.Lock()
         self._debounce_task: asyncio.Task[None] | None = None
         self._unsubscribe: Callable[[], None] | None = None
+        self._pending_events: deque[Any] = deque()
+        self._drain_scheduled = False
+        self._published_snapshot: Any = _UNSET
+        self._published_ready: bool | None = None
 
     async def async_start(self) -> None:
         """Subscribe to hub events and seed snapshot data."""
@@ -71,6 +87,7 @@ class Elke27DataUpdateCoordinator(DataUpdateCoordinator[PanelSnapshot]):
         if self._unsubscribe is not None:
             self._unsubscribe()
             self._unsubscribe = None
+        self._pending_events.clear()
         if self._debounce_task is not None:
             self._debounce_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
@@ -83,8 +100,26 @@ class Elke27DataUpdateCoordinator(DataUpdateCoordinator[PanelSnapshot]):
         self._set_snapshot(self._hub.get_snapshot())
 
     def _handle_event(self, event: Any) -> None:
-        """Handle hub events on the Home Assistant event loop."""
-        self.hass.loop.call_soon_threadsafe(self._process_event, event)
+        """Queue hub events and schedule one drain on the event loop."""
+        self._pending_events.append(event)
+        if self._drain_scheduled:
+            return
+        self._drain_scheduled = True
+        self.hass.loop.call_soon_threadsafe(self._drain_events)
+
+    @callback
+    def _drain_events(self) -> None:
+        """Process every queued hub event in a single loop iteration."""
+        self._drain_scheduled = False
+        pending = self._pending_events
+        try:
+            while pending:
+                self._process_event(pending.popleft())
+        finally:
+            # Don't strand the rest of the burst if one event's listeners raised.
+            if pending and not self._drain_scheduled:
+                self._drain_scheduled = True
+                self.hass.loop.call_soon(self._drain_events)
 
     @callback
     def _process_event(self, event: Any) -> None:
@@ -102,14 +137,7 @@ class Elke27DataUpdateCoordinator(DataUpdateCoordinator[PanelSnapshot]):
         if _is_event(event, CsmSnapshotUpdated, "CsmSnapshotUpdated"):
             self._set_snapshot(self._hub.get_snapshot())
             return
-        if _is_event(event, DomainCsmChanged, "DomainCsmChanged"):
-            domain = getattr(event, "domain", None) or getattr(
-                event, "csm_domain", None
-            )
-            if domain:
-                self._queue_domain_refresh({str(domain)})
-            return
-        if _is_event(event, TableCsmChanged, "TableCsmChanged"):
+        if _is_domain_refresh_event(event):
             domain = getattr(event, "domain", None) or getattr(
                 event, "csm_domain", None
             )
@@ -145,7 +173,13 @@ class Elke27DataUpdateCoordinator(DataUpdateCoordinator[PanelSnapshot]):
         self._set_snapshot(self._hub.get_snapshot())
 
     def _set_snapshot(self, snapshot: PanelSnapshot | None) -> None:
-        """Update coordinator data and track snapshot version."""
+        """Update coordinator data when the snapshot or readiness changed."""
+        ready = self._hub.is_ready
+        # Snapshots are immutable and replaced on change, so identity is enough.
+        if snapshot is self._published_snapshot and ready == self._published_ready:
+            return
+        self._published_snapshot = snapshot
+        self._published_ready = ready
         self.async_set_updated_data(snapshot)
 
 
@@ -155,6 +189,12 @@ def _is_event(event: Any, klass: type[Any] | None, name: str) -> bool:
     return event.__class__.__name__ == name
 
 
+def _is_domain_refresh_event(event: Any) -> bool:
+    if _DOMAIN_REFRESH_EVENT_CLASSES:
+        return isinstance(event, _DOMAIN_REFRESH_EVENT_CLASSES)
+    return event.__class__.__name__ in _DOMAIN_REFRESH_EVENT_NAMES
+
+
 def _normalize_domains(domains: Iterable[str] | str | None) -> set[str]:
     if domains is None:
         return set()
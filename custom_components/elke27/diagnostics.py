@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from dataclasses import fields, is_dataclass
 from datetime import date, datetime
 import enum
@@ -51,23 +51,58 @@ async def async_get_config_entry_diagnostics(
     }
 
 
+def _mapping_to_jsonable(value: Mapping[Any, Any]) -> dict[str, Any]:
+    return {str(key): _to_jsonable(val) for key, val in value.items()}
+
+
+def _sequence_to_jsonable(value: list[Any] | tuple[Any, ...]) -> list[Any]:
+    return [_to_jsonable(item) for item in value]
+
+
+def _set_to_jsonable(value: set[Any] | frozenset[Any]) -> list[Any]:
+    return sorted([_to_jsonable(item) for item in value], key=str)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+# Exact-type handlers for the common snapshot leaf and container types.
+_JSONABLE_BY_TYPE: dict[type[Any], Callable[[Any], Any]] = {
+    type(None): _identity,
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    dict: _mapping_to_jsonable,
+    MappingProxyType: _mapping_to_jsonable,
+    list: _sequence_to_jsonable,
+    tuple: _sequence_to_jsonable,
+    set: _set_to_jsonable,
+    frozenset: _set_to_jsonable,
+    bytes: bytes.hex,
+    bytearray: bytearray.hex,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+}
+
+
 def _to_jsonable(value: Any) -> Any:
     """Normalize snapshots to JSON-safe types."""
-    if value is None:
-        return None
+    handler = _JSONABLE_BY_TYPE.get(type(value))
+    if handler is not None:
+        return handler(value)
     if is_dataclass(value):
         return {
             field.name: _to_jsonable(getattr(value, field.name))
             for field in fields(value)
         }
-    if isinstance(value, MappingProxyType):
-        return {str(key): _to_jsonable(val) for key, val in dict(value).items()}
     if isinstance(value, Mapping):
-        return {str(key): _to_jsonable(val) for key, val in value.items()}
+        return _mapping_to_jsonable(value)
     if isinstance(value, list | tuple):
-        return [_to_jsonable(item) for item in value]
+        return _sequence_to_jsonable(value)
     if isinstance(value, set | frozenset):
-        return sorted([_to_jsonable(item) for item in value], key=str)
+        return _set_to_jsonable(value)
     if isinstance(value, bytes | bytearray):
         return value.hex()
     if isinstance(value, enum.Enum):
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
-import re
+from collections.abc import Mapping
+from contextlib import contextmanager
+import logging
 from typing import TYPE_CHECKING, Any
 
+from elke27_lib.errors import Elke27PinRequiredError
+
 from homeassistant.const import CONF_HOST
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import (
     CONNECTION_NETWORK_MAC,
     DeviceInfo,
@@ -15,12 +21,17 @@ from homeassistant.helpers.device_registry import (
 from .const import CONF_INTEGRATION_SERIAL, DOMAIN, MANUFACTURER_NUMBER
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
     from homeassistant.config_entries import ConfigEntry
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
     from .coordinator import Elke27DataUpdateCoordinator
     from .hub import Elke27Hub
+    from .models import Elke27RuntimeData
 
-_NAME_SAFE_RE = re.compile(r"[^A-Za-z0-9 _-]")
+_LOGGER = logging.getLogger(__name__)
 
 
 def sanitize_name(name: str | None) -> str | None:
@@ -34,11 +45,17 @@ def get_panel_field(snapshot: Any | None, panel_name: str | None, field: str) ->
     """Return a field from the current panel snapshot."""
     if field == "name" and panel_name:
         return sanitize_name(panel_name)
+    return _panel_info_field(_panel_info(snapshot), field)
+
+
+def _panel_info(snapshot: Any | None) -> Any:
     if snapshot is None:
         return None
-    panel_info = getattr(snapshot, "panel_info", None) or getattr(
-        snapshot, "panel", None
-    )
+    # PanelSnapshot exposes "panel"; "panel_info" is only a legacy fallback.
+    return getattr(snapshot, "panel", None) or getattr(snapshot, "panel_info", None)
+
+
+def _panel_info_field(panel_info: Any, field: str) -> Any:
     if panel_info is None:
         return None
     if isinstance(panel_info, dict):
@@ -52,18 +69,104 @@ def get_panel_field(snapshot: Any | None, panel_name: str | None, field: str) ->
     return getattr(panel_info, field, None)
 
 
+def iter_snapshot_items(snapshot: Any | None, collection: str) -> Iterable[Any]:
+    """Return the items of a snapshot collection such as areas or zones."""
+    items = getattr(snapshot, collection, None)
+    if isinstance(items, Mapping):
+        return items.values()
+    if isinstance(items, list | tuple):
+        return items
+    return ()
+
+
+def get_snapshot_item(
+    snapshot: Any | None, collection: str, id_field: str, item_id: int
+) -> Any | None:
+    """Return the item of a snapshot collection with the given id."""
+    items = getattr(snapshot, collection, None)
+    if isinstance(items, Mapping):
+        item = items.get(item_id)
+        if item is not None and getattr(item, id_field, None) == item_id:
+            return item
+        items = items.values()
+    elif not isinstance(items, list | tuple):
+        return None
+    for item in items:
+        if getattr(item, id_field, None) == item_id:
+            return item
+    return None
+
+
+@callback
+def async_setup_snapshot_entities(
+    entry: ConfigEntry,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+    *,
+    collection: str,
+    id_field: str,
+    label: str,
+    entity_factory: Callable[
+        [Elke27DataUpdateCoordinator, Elke27Hub, ConfigEntry, int, Any], Entity
+    ],
+) -> None:
+    """Add entities for a snapshot collection and for items that appear later."""
+    data: Elke27RuntimeData | None = entry.runtime_data
+    if data is None:
+        _LOGGER.debug("Skipping %s setup because runtime data is missing", label)
+        return
+    hub = data.hub
+    coordinator = data.coordinator
+    known_ids: set[int] = set()
+
+    @callback
+    def _async_add_items() -> None:
+        snapshot = coordinator.data
+        if snapshot is None:
+            _LOGGER.debug("%s entities skipped because snapshot is unavailable", label)
+            return
+        items = iter_snapshot_items(snapshot, collection)
+        if not items:
+            _LOGGER.debug("No %s available for entity creation", collection)
+            return
+        entities: list[Entity] = []
+        for item in items:
+            item_id = getattr(item, id_field, None)
+            if not isinstance(item_id, int) or item_id in known_ids:
+                continue
+            known_ids.add(item_id)
+            entities.append(entity_factory(coordinator, hub, entry, item_id, item))
+        if entities:
+            _LOGGER.debug("Adding %s %s entities", len(entities), label)
+            async_add_entities(entities)
+
+    _async_add_items()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_items))
+
+
+@contextmanager
+def pin_required_error() -> Iterator[None]:
+    """Raise a missing-PIN error from the client as a Home Assistant error."""
+    try:
+        yield
+    except Elke27PinRequiredError as err:
+        msg = "PIN required to perform this action."
+        raise HomeAssistantError(msg) from err
+
+
 def device_info_for_entry(
     hub: Elke27Hub,
     coordinator: Elke27DataUpdateCoordinator,
     entry: ConfigEntry,
 ) -> DeviceInfo:
     """Build device info for entities tied to a config entry."""
-    snapshot = coordinator.data
-    panel_name = get_panel_field(snapshot, hub.panel_name, "name") or entry.title
-    mac = get_panel_field(snapshot, hub.panel_name, "mac")
-    panel_serial = get_panel_field(snapshot, hub.panel_name, "serial")
-    model = get_panel_field(snapshot, hub.panel_name, "model")
-    firmware = get_panel_field(snapshot, hub.panel_name, "firmware")
+    panel_info = _panel_info(coordinator.data)
+    panel_name = (
+        sanitize_name(hub.panel_name) or _panel_info_field(panel_info, "name")
+    ) or entry.title
+    mac = _panel_info_field(panel_info, "mac")
+    panel_serial = _panel_info_field(panel_info, "serial")
+    model = _panel_info_field(panel_info, "model")
+    firmware = _panel_info_field(panel_info, "firmware")
     integration_serial = entry.data.get(CONF_INTEGRATION_SERIAL)
     identifier = (
         f"{MANUFACTURER_NUMBER}-{integration_serial}"
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import contextlib
 from enum import Enum
-from functools import partial
+from functools import lru_cache, partial
 import inspect
 import logging
 from typing import TYPE_CHECKING, Any
@@ -64,9 +64,10 @@ class Elke27Hub:
     @property
     def is_ready(self) -> bool:
         """Return if the client is ready."""
-        if self._client is None:
+        client = self._client
+        if client is None:
             return False
-        return bool(getattr(self._client, "is_ready", False))
+        return bool(client.is_ready)
 
     @property
     def panel_name(self) -> str | None:
@@ -154,7 +155,7 @@ class Elke27Hub:
         client = self._client
         if client is None:
             return None
-        return getattr(client, "snapshot", None)
+        return client.snapshot
 
     async def refresh_csm(self) -> Any:
         """Refresh the panel CSM snapshot."""
@@ -187,11 +188,7 @@ class Elke27Hub:
         client = self._client
         if client is not None:
             self._typed_callbacks[listener] = client.subscribe_typed(listener)
-
-        def _remove() -> None:
-            self.unsubscribe_typed(listener)
-
-        return _remove
+        return partial(self.unsubscribe_typed, listener)
 
     def unsubscribe_typed(self, listener: Callable[[Any], None]) -> bool:
         """Unsubscribe from typed client events."""
@@ -205,6 +202,18 @@ class Elke27Hub:
             return False
         return client.unsubscribe_typed(listener)
 
+    async def _async_call_client(
+        self, method: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> bool:
+        """Call a sync or async client method and coerce its result."""
+        if inspect.iscoroutinefunction(method):
+            result = await method(*args, **kwargs)
+        else:
+            result = await self._hass.async_add_executor_job(
+                partial(method, *args, **kwargs)
+            )
+        return bool(result) if isinstance(result, bool) else True
+
     async def async_set_output(self, output_id: int, *, state: bool) -> bool:
         """Request an output state change if supported."""
         client = self._client
@@ -220,19 +229,9 @@ class Elke27Hub:
                 output_id,
             )
             return False
-        params = inspect.signature(method).parameters
-        if "on" in params:
-            if inspect.iscoroutinefunction(method):
-                result = await method(output_id, on=state)
-            else:
-                result = await self._hass.async_add_executor_job(
-                    partial(method, output_id, on=state)
-                )
-        elif inspect.iscoroutinefunction(method):
-            result = await method(output_id, state)
-        else:
-            result = await self._hass.async_add_executor_job(method, output_id, state)
-        return bool(result) if isinstance(result, bool) else True
+        if "on" in _method_params(method):
+            return await self._async_call_client(method, output_id, on=state)
+        return await self._async_call_client(method, output_id, state)
 
     async def async_set_light(
         self, light_id: int, *, state: bool, level: int | None = None
@@ -246,38 +245,23 @@ class Elke27Hub:
         if method is None:
             method = getattr(client, "set_light", None)
         if method is not None:
-            params = inspect.signature(method).parameters
-            if "on" in params:
-                if inspect.iscoroutinefunction(method):
-                    result = await method(light_id, on=state)
-                else:
-                    result = await self._hass.async_add_executor_job(
-                        partial(method, light_id, on=state)
-                    )
-            elif inspect.iscoroutinefunction(method):
-                result = await method(light_id, state)
-            else:
-                result = await self._hass.async_add_executor_job(
-                    method, light_id, state
-                )
-            return bool(result) if isinstance(result, bool) else True
+            if "on" in _method_params(method):
+                return await self._async_call_client(method, light_id, on=state)
+            return await self._async_call_client(method, light_id, state)
 
-        status = "ON" if state else "OFF"
-        payload: dict[str, Any] = {
-            "light_id": light_id,
-            "status": status,
-        }
         if state:
-            payload["level"] = level if level is not None else 99
-        if not state:
-            payload["level"] = 0
-        result = await client.async_execute("light_set_status", **payload)
-        if not getattr(result, "ok", False):
-            error = getattr(result, "error", None)
-            if error is not None:
-                raise error
-            return False
-        return True
+            status = "ON"
+            level = level if level is not None else 99
+        else:
+            status = "OFF"
+            level = 0
+        result = await client.async_execute(
+            "light_set_status",
+            light_id=light_id,
+            status=status,
+            level=level,
+        )
+        return _result_ok(result)
 
     async def async_set_lock(self, lock_id: int, *, locked: bool) -> bool:
         """Request a lock state change if supported."""
@@ -289,28 +273,12 @@ class Elke27Hub:
         if method is None:
             method = getattr(client, "set_lock", None)
         if method is not None:
-            params = inspect.signature(method).parameters
+            params = _method_params(method)
             if "locked" in params:
-                if inspect.iscoroutinefunction(method):
-                    result = await method(lock_id, locked=locked)
-                else:
-                    result = await self._hass.async_add_executor_job(
-                        partial(method, lock_id, locked=locked)
-                    )
-            elif "on" in params:
-                if inspect.iscoroutinefunction(method):
-                    result = await method(lock_id, on=locked)
-                else:
-                    result = await self._hass.async_add_executor_job(
-                        partial(method, lock_id, on=locked)
-                    )
-            elif inspect.iscoroutinefunction(method):
-                result = await method(lock_id, locked)
-            else:
-                result = await self._hass.async_add_executor_job(
-                    method, lock_id, locked
-                )
-            return bool(result) if isinstance(result, bool) else True
+                return await self._async_call_client(method, lock_id, locked=locked)
+            if "on" in params:
+                return await self._async_call_client(method, lock_id, on=locked)
+            return await self._async_call_client(method, lock_id, locked)
 
         status = "ON" if locked else "OFF"
         result = await client.async_execute(
@@ -318,12 +286,7 @@ class Elke27Hub:
             lock_id=lock_id,
             status=status,
         )
-        if not getattr(result, "ok", False):
-            error = getattr(result, "error", None)
-            if error is not None:
-                raise error
-            return False
-        return True
+        return _result_ok(result)
 
     async def async_set_tstat_status(
         self,
@@ -339,15 +302,15 @@ class Elke27Hub:
         if client is None:
             return False
 
-        kwargs: dict[str, Any] = {
-            "mode": mode,
-            "fan_mode": fan_mode,
-            "cool_setpoint": cool_setpoint,
-            "heat_setpoint": heat_setpoint,
-        }
-        filtered_kwargs = {
-            key: value for key, value in kwargs.items() if value is not None
-        }
+        filtered_kwargs: dict[str, Any] = {}
+        if mode is not None:
+            filtered_kwargs["mode"] = mode
+        if fan_mode is not None:
+            filtered_kwargs["fan_mode"] = fan_mode
+        if cool_setpoint is not None:
+            filtered_kwargs["cool_setpoint"] = cool_setpoint
+        if heat_setpoint is not None:
+            filtered_kwargs["heat_setpoint"] = heat_setpoint
         if not filtered_kwargs:
             return True
 
@@ -355,25 +318,14 @@ class Elke27Hub:
         if method is None:
             method = getattr(client, "set_tstat_status", None)
         if method is not None:
-            if inspect.iscoroutinefunction(method):
-                result = await method(tstat_id, **filtered_kwargs)
-            else:
-                result = await self._hass.async_add_executor_job(
-                    partial(method, tstat_id, **filtered_kwargs)
-                )
-            return bool(result) if isinstance(result, bool) else True
+            return await self._async_call_client(method, tstat_id, **filtered_kwargs)
 
         result = await client.async_execute(
             "tstat_set_status",
             tstat_id=tstat_id,
             **filtered_kwargs,
         )
-        if not getattr(result, "ok", False):
-            error = getattr(result, "error", None)
-            if error is not None:
-                raise error
-            return False
-        return True
+        return _result_ok(result)
 
     async def async_set_zone_bypass(
         self, zone_id: int, *, bypassed: bool, pin: str | None = None
@@ -382,14 +334,7 @@ class Elke27Hub:
         client = self._client
         if client is None:
             return False
-        if pin is None:
-            msg = "PIN required to bypass zones."
-            raise Elke27PinRequiredError(msg)
-        try:
-            pin_value = int(pin)
-        except (TypeError, ValueError) as err:
-            msg = "Code must be numeric."
-            raise HomeAssistantError(msg) from err
+        pin_value = _pin_value(pin, "bypass zones")
         _LOGGER.debug(
             "Sending zone bypass request: zone_id=%s bypassed=%s pin=%s",
             zone_id,
@@ -397,7 +342,8 @@ class Elke27Hub:
             pin_value,
         )
         timeout_s = 15.0
-        start = self._hass.loop.time()
+        loop_time = self._hass.loop.time
+        start = loop_time()
         result = await client.async_execute(
             "zone_set_status",
             zone_id=zone_id,
@@ -405,19 +351,14 @@ class Elke27Hub:
             bypassed=bypassed,
             timeout_s=timeout_s,
         )
-        elapsed = self._hass.loop.time() - start
+        elapsed = loop_time() - start
         _LOGGER.debug(
             "Zone bypass reply for zone %s in %.2fs (timeout %.1fs)",
             zone_id,
             elapsed,
             timeout_s,
         )
-        if not getattr(result, "ok", False):
-            error = getattr(result, "error", None)
-            if error is not None:
-                raise error
-            return False
-        return True
+        return _result_ok(result)
 
     async def async_arm_area(
         self,
@@ -432,14 +373,7 @@ class Elke27Hub:
         client = self._client
         if client is None:
             return False
-        if pin is None:
-            msg = "PIN required to arm areas."
-            raise Elke27PinRequiredError(msg)
-        try:
-            pin_value = int(pin)
-        except (TypeError, ValueError) as err:
-            msg = "Code must be numeric."
-            raise HomeAssistantError(msg) from err
+        pin_value = _pin_value(pin, "arm areas")
 
         if mode is ArmMode.ARMED_STAY:
             arm_state = "ARMED_STAY"
@@ -456,19 +390,15 @@ class Elke27Hub:
         method = getattr(client, "async_arm_area", None)
         if callable(method):
             with contextlib.suppress(TypeError, ValueError):
-                params = inspect.signature(method).parameters
+                params = _method_params(method)
                 kwargs: dict[str, Any] = {}
                 if "auto_stay_cancel" in params:
                     kwargs["auto_stay_cancel"] = auto_stay_cancel
                 if "exit_delay_cancel" in params:
                     kwargs["exit_delay_cancel"] = exit_delay_cancel
-                if inspect.iscoroutinefunction(method):
-                    result = await method(area_id, pin, mode, **kwargs)
-                else:
-                    result = await self._hass.async_add_executor_job(
-                        partial(method, area_id, pin, mode, **kwargs)
-                    )
-                return bool(result) if isinstance(result, bool) else True
+                return await self._async_call_client(
+                    method, area_id, pin, mode, **kwargs
+                )
 
         result = await client.async_execute(
             "area_set_arm_state",
@@ -478,20 +408,7 @@ class Elke27Hub:
             auto_stay_cancel=auto_stay_cancel,
             exit_delay_cancel=exit_delay_cancel,
         )
-        if not getattr(result, "ok", False):
-            error = getattr(result, "error", None)
-            error_message = getattr(error, "user_message", None) or getattr(
-                error, "message", None
-            )
-            _LOGGER.warning(
-                "Area arming failed for area %s: %s",
-                area_id,
-                error_message or error,
-            )
-            if error is not None:
-                raise HomeAssistantError(error_message or str(error)) from error
-            return False
-        return True
+        return _area_result_ok(result, "arming", area_id)
 
     def _resubscribe_typed_callbacks(self) -> None:
         """Re-register typed callbacks on a new client connection."""
@@ -520,31 +437,18 @@ class Elke27Hub:
         client = self._client
         if client is None:
             return False
-        if pin is None:
-            msg = "PIN required to disarm areas."
-            raise Elke27PinRequiredError(msg)
-        try:
-            pin_value = int(pin)
-        except (TypeError, ValueError) as err:
-            msg = "Code must be numeric."
-            raise HomeAssistantError(msg) from err
+        pin_value = _pin_value(pin, "disarm areas")
 
         method = getattr(client, "async_disarm_area", None)
         if callable(method):
             with contextlib.suppress(TypeError, ValueError):
-                params = inspect.signature(method).parameters
+                params = _method_params(method)
                 kwargs: dict[str, Any] = {}
                 if "auto_stay_cancel" in params:
                     kwargs["auto_stay_cancel"] = auto_stay_cancel
                 if "exit_delay_cancel" in params:
                     kwargs["exit_delay_cancel"] = exit_delay_cancel
-                if inspect.iscoroutinefunction(method):
-                    result = await method(area_id, pin, **kwargs)
-                else:
-                    result = await self._hass.async_add_executor_job(
-                        partial(method, area_id, pin, **kwargs)
-                    )
-                return bool(result) if isinstance(result, bool) else True
+                return await self._async_call_client(method, area_id, pin, **kwargs)
 
         result = await client.async_execute(
             "area_set_arm_state",
@@ -554,20 +458,7 @@ class Elke27Hub:
             auto_stay_cancel=auto_stay_cancel,
             exit_delay_cancel=exit_delay_cancel,
         )
-        if not getattr(result, "ok", False):
-            error = getattr(result, "error", None)
-            error_message = getattr(error, "user_message", None) or getattr(
-                error, "message", None
-            )
-            _LOGGER.warning(
-                "Area disarm failed for area %s: %s",
-                area_id,
-                error_message or error,
-            )
-            if error is not None:
-                raise HomeAssistantError(error_message or str(error)) from error
-            return False
-        return True
+        return _area_result_ok(result, "disarm", area_id)
 
     def _handle_connection_event(self, event: Any) -> None:
         """Handle connection lifecycle events from the client."""
@@ -635,6 +526,57 @@ class Elke27Hub:
             await asyncio.sleep(delay)
 
 
+def _method_params(method: Any) -> frozenset[str]:
+    """Return the parameter names of a client method, cached per function."""
+    return _function_params(getattr(method, "__func__", method))
+
+
+@lru_cache(maxsize=32)
+def _function_params(func: Any) -> frozenset[str]:
+    return frozenset(inspect.signature(func).parameters)
+
+
+def _pin_value(pin: str | None, action: str) -> int:
+    """Validate a user-supplied PIN and return it as an integer."""
+    if pin is None:
+        msg = f"PIN required to {action}."
+        raise Elke27PinRequiredError(msg)
+    try:
+        return int(pin)
+    except (TypeError, ValueError) as err:
+        msg = "Code must be numeric."
+        raise HomeAssistantError(msg) from err
+
+
+def _result_ok(result: Any) -> bool:
+    """Return True for a successful execute result, raising its error if any."""
+    if getattr(result, "ok", False):
+        return True
+    error = getattr(result, "error", None)
+    if error is not None:
+        raise error
+    return False
+
+
+def _area_result_ok(result: Any, action: str, area_id: int) -> bool:
+    """Return True for a successful area command, raising a readable error."""
+    if getattr(result, "ok", False):
+        return True
+    error = getattr(result, "error", None)
+    error_message = getattr(error, "user_message", None) or getattr(
+        error, "message", None
+    )
+    _LOGGER.warning(
+        "Area %s failed for area %s: %s",
+        action,
+        area_id,
+        error_message or error,
+    )
+    if error is not None:
+        raise HomeAssistantError(error_message or str(error)) from error
+    return False
+
+
 def _event_type(event: Any) -> str | None:
     if isinstance(event, dict):
         value = event.get("type") or event.get("event_type") or event.get("domain")
@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
 import logging
 from typing import TYPE_CHECKING, Any, ClassVar
 
-from elke27_lib.errors import Elke27PinRequiredError
-
 from homeassistant.components.light import ATTR_BRIGHTNESS, ColorMode, LightEntity
-from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import Elke27DataUpdateCoordinator
-from .entity import build_unique_id, device_info_for_entry, sanitize_name, unique_base
+from .entity import (
+    async_setup_snapshot_entities,
+    build_unique_id,
+    device_info_for_entry,
+    get_snapshot_item,
+    pin_required_error,
+    sanitize_name,
+    unique_base,
+)
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -21,7 +25,6 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
     from .hub import Elke27Hub
-    from .models import Elke27RuntimeData
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,37 +38,14 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up Elke27 lights from a config entry."""
-    data: Elke27RuntimeData | None = entry.runtime_data
-    if data is None:
-        _LOGGER.debug("Skipping light setup because runtime data is missing")
-        return
-    hub = data.hub
-    coordinator = data.coordinator
-    known_ids: set[int] = set()
-
-    def _async_add_lights() -> None:
-        snapshot = coordinator.data
-        if snapshot is None:
-            _LOGGER.debug("Light entities skipped because snapshot is unavailable")
-            return
-        entities: list[Elke27Light] = []
-        lights = list(_iter_lights(snapshot))
-        if not lights:
-            _LOGGER.debug("No lights available for entity creation")
-            return
-        for light in lights:
-            light_id = getattr(light, "light_id", None)
-            if not isinstance(light_id, int):
-                continue
-            if light_id in known_ids:
-                continue
-            known_ids.add(light_id)
-            entities.append(Elke27Light(coordinator, hub, entry, light_id, light))
-        if entities:
-            async_add_entities(entities)
-
-    _async_add_lights()
-    entry.async_on_unload(coordinator.async_add_listener(_async_add_lights))
+    async_setup_snapshot_entities(
+        entry,
+        async_add_entities,
+        collection="lights",
+        id_field="light_id",
+        label="light",
+        entity_factory=Elke27Light,
+    )
 
 
 class Elke27Light(CoordinatorEntity[Elke27DataUpdateCoordinator], LightEntity):
@@ -129,7 +109,7 @@ class Elke27Light(CoordinatorEntity[Elke27DataUpdateCoordinator], LightEntity):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the light on if supported by the client."""
-        try:
+        with pin_required_error():
             if ATTR_BRIGHTNESS in kwargs:
                 level = _level_from_kwargs(kwargs)
                 await self._hub.async_set_light(self._light_id, state=True, level=level)
@@ -137,17 +117,11 @@ class Elke27Light(CoordinatorEntity[Elke27DataUpdateCoordinator], LightEntity):
                 await self._hub.async_set_light(
                     self._light_id, state=True, level=_ELK_MAX_DIM_LEVEL
                 )
-        except Elke27PinRequiredError as err:
-            msg = "PIN required to perform this action."
-            raise HomeAssistantError(msg) from err
 
     async def async_turn_off(self, **_kwargs: Any) -> None:
         """Turn the light off if supported by the client."""
-        try:
+        with pin_required_error():
             await self._hub.async_set_light(self._light_id, state=False, level=0)
-        except Elke27PinRequiredError as err:
-            msg = "PIN required to perform this action."
-            raise HomeAssistantError(msg) from err
 
     @property
     def available(self) -> bool:
@@ -175,19 +149,5 @@ def _level_from_kwargs(kwargs: dict[str, Any]) -> int:
     return _ELK_MAX_DIM_LEVEL
 
 
-def _iter_lights(snapshot: Any) -> Iterable[Any]:
-    lights = getattr(snapshot, "lights", None)
-    if lights is None:
-        return []
-    if isinstance(lights, Mapping):
-        return list(lights.values())
-    if isinstance(lights, list | tuple):
-        return lights
-    return []
-
-
 def _get_light(snapshot: Any, light_id: int) -> Any | None:
-    for light in _iter_lights(snapshot):
-        if getattr(light, "light_id", None) == light_id:
-            return light
-    return None
+    return get_snapshot_item(snapshot, "lights", "light_id", light_id)
@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping
 import logging
 from typing import TYPE_CHECKING, Any
 
-from elke27_lib.errors import Elke27PinRequiredError
-
 from homeassistant.components.lock import LockEntity
-from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import Elke27DataUpdateCoordinator
-from .entity import build_unique_id, device_info_for_entry, sanitize_name, unique_base
+from .entity import (
+    async_setup_snapshot_entities,
+    build_unique_id,
+    device_info_for_entry,
+    get_snapshot_item,
+    pin_required_error,
+    sanitize_name,
+    unique_base,
+)
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -21,7 +25,6 @@ if TYPE_CHECKING:
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
     from .hub import Elke27Hub
-    from .models import Elke27RuntimeData
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,37 +37,14 @@ async def async_setup_entry(
     async_add_entities: AddConfigEntryEntitiesCallback,
 ) -> None:
     """Set up Elke27 locks from a config entry."""
-    data: Elke27RuntimeData | None = entry.runtime_data
-    if data is None:
-        _LOGGER.debug("Skipping lock setup because runtime data is missing")
-        return
-    hub = data.hub
-    coordinator = data.coordinator
-    known_ids: set[int] = set()
-
-    def _async_add_locks() -> None:
-        snapshot = coordinator.data
-        if snapshot is None:
-            _LOGGER.debug("Lock entities skipped because snapshot is unavailable")
-            return
-        entities: list[Elke27Lock] = []
-        locks = list(_iter_locks(snapshot))
-        if not locks:
-            _LOGGER.debug("No locks available for entity creation")
-            return
-        for lock in locks:
-            lock_id = getattr(lock, "lock_id", None)
-            if not isinstance(lock_id, int):
-                continue
-            if lock_id in known_ids:
-                continue
-            known_ids.add(lock_id)
-            entities.append(Elke27Lock(coordinator, hub, entry, lock_id, lock))
-        if entities:
-            async_add_entities(entities)
-
-    _async_add_locks()
-    entry.async_on_unload(coordinator.async_add_listener(_async_add_locks))
+    async_setup_snapshot_entities(
+        entry,
+        async_add_entities,
+        collection="locks",
+        id_field="lock_id",
+        label="lock",
+        entity_factory=Elke27Lock,
+    )
 
 
 class Elke27Lock(CoordinatorEntity[Elke27DataUpdateCoordinator], LockEntity):
@@ -125,19 +105,13 @@ class Elke27Lock(CoordinatorEntity[Elke27DataUpdateCoordinator], LockEntity):
 
     async def async_lock(self, **_kwargs: Any) -> None:
         """Lock if supported by the client."""
-        try:
+        with pin_required_error():
             await self._hub.async_set_lock(self._lock_id, locked=True)
-        except Elke27PinRequiredError as err:
-            msg = "PIN required to perform this action."
-            raise HomeAssistantError(msg) from err
 
     async def async_unlock(self, **_kwargs: Any) -> None:
         """Unlock if supported by the client."""
-        try:
+        with pin_required_error():
             await self._hub.async_set_lock(self._lock_id, locked=False)
-        except Elke27PinRequiredError as err:
-            msg = "PIN required to perform this action."
-            raise HomeAssistantError(msg) from err
 
     def _log_missing(self) -> None:
         """Log when the lock snapshot is missing."""
@@ -147,19 +121,5 @@ class Elke27Lock(CoordinatorEntity[Elke27DataUpdateCoordinator], LockEntity):
         _LOGGER.debug("Lock %s missing from snapshot", self._lock_id)
 
 
-def _iter_locks(snapshot: Any) -> Iterable[Any]:
-    locks = getattr(snapshot, "locks", None)
-    if locks is None:
-        return []
-    if isinstance(locks, Mapping):
-        return list(locks.values())
-    if isinstance(locks, list | tuple):
-        return locks
-    return []
-
-
 def _get_lock(snapshot: Any, lock_id: int) -> Any | None:
-    for lock in _iter_locks(snapshot):
-        if getattr(lock, "lock_id", None) == lock_id:
-            return lock
-    return None
+    return get_snapshot_item(snapshot, "locks", "lock_id", lock_id)